@@ -1,19 +1,30 @@
-from .interpreter import nock_interpreter, heap, heap_get, heap_set, is_cell, get_head, get_tail, get_value
+from .interpreter import (nock_interpreter, nock_wavefront, heap_tags, heap_heads, heap_tails, heap_get, heap_set,
+                          is_cell, get_head, get_tail, get_value, is_vector, vector_span, vector_elems)
 from .utils import create_noun, print_noun
 
-def nock(subject, formula):
+def nock(subject, formula, wavefront=False):
     """
     Evaluate a Nock expression *[subject formula].
+    With wavefront=True, independent subcomputations are dispatched together.
     """
     subject_idx = create_noun(subject)
     formula_idx = create_noun(formula)
-    result_idx = nock_interpreter(subject_idx, formula_idx)
+    if wavefront:
+        result_idx = nock_wavefront(subject_idx, formula_idx)
+    else:
+        result_idx = nock_interpreter(subject_idx, formula_idx)
     return noun_to_python(result_idx)
 
 def noun_to_python(idx):
     """
-    Convert a heap index back to a Python representation.
+    Convert a noun reference back to a Python representation.
     """
+    if is_vector(idx):
+        start, end = vector_span(idx)
+        result = noun_to_python(vector_elems[end - 1])
+        for pos in range(end - 2, start - 1, -1):
+            result = [noun_to_python(vector_elems[pos]), result]
+        return result
     if is_cell(idx):
         return [noun_to_python(get_head(idx)), noun_to_python(get_tail(idx))]
     else:
@@ -6,24 +6,75 @@ import pypim as pim
 
 HEAP_SIZE = 10000  # heap tensor
 STACK_SIZE = 1000  # stack tensor
-
-heap = pim.Tensor(HEAP_SIZE, 3, dtype=pim.int32)  # [tag, value/head, tail]
-stack = pim.Tensor(STACK_SIZE, 6, dtype=pim.int32) # [task_type, arg1, arg2, arg3]
+VECTOR_SIZE = 10000  # vector noun element tensor
+FRAME_SIZE = 10000  # wavefront frame tensor
+WAVE_SIZE = 1000  # wavefront operand staging tensor
+TAG_BITS = 32  # cell tags packed per heap_tags word
+SMALL_ATOM_LIMIT = 2 ** 30  # atoms below this are stored inline in references
+
+# struct-of-arrays heap: one column per field, tags bit-packed (1 = cell)
+heap_tags = pim.Tensor((HEAP_SIZE + TAG_BITS - 1) // TAG_BITS, dtype=pim.int32)
+heap_heads = pim.Tensor(HEAP_SIZE, dtype=pim.int32)  # atom value or head reference
+heap_tails = pim.Tensor(HEAP_SIZE, dtype=pim.int32)  # tail reference
+stack = pim.Tensor(STACK_SIZE, 6, dtype=pim.int32) # [task_type, arg1, arg2, arg3, arg4, arg5]
+# vector nouns: runs of elements read as right-nested cells [e0 [e1 ... e(n-1)]]
+vector_elems = pim.Tensor(VECTOR_SIZE, dtype=pim.int32)  # element reference
+vector_ends = pim.Tensor(VECTOR_SIZE, dtype=pim.int32)   # end position of the element's run
+frames = pim.Tensor(FRAME_SIZE, 8, dtype=pim.int32) # [task_type, arg1, ..., arg5, parent, pending]
 free = pim.Tensor(1, dtype=pim.int32)  # Next free heap index
 top = pim.Tensor(1, dtype=pim.int32)   # Stack top index
+vector_free = pim.Tensor(1, dtype=pim.int32)  # Next free vector position
+frame_free = pim.Tensor(1, dtype=pim.int32)  # Next never-used frame index
+frame_pool = pim.Tensor(FRAME_SIZE, dtype=pim.int32)  # Released frames for reuse
+frame_pool_top = pim.Tensor(1, dtype=pim.int32)  # Frame pool top index
+waves = pim.Tensor(1, dtype=pim.int32)  # Waves taken by the last wavefront evaluation
+wave_operands = pim.Tensor(WAVE_SIZE, dtype=pim.int32)  # Operands staged for a batched op
+wave_ones = pim.Tensor(WAVE_SIZE, dtype=pim.int32)  # Increment addend
 
 free[0] = 0
 top[0] = 0
+vector_free[0] = 0
+frame_free[0] = 0
+frame_pool_top[0] = 0
+waves[0] = 0
+for k in range(WAVE_SIZE):
+    wave_ones[k] = 1
+
+def to_int32(value):
+    """Wrap a Python int into the signed int32 range."""
+    return (value + 2 ** 31) % 2 ** 32 - 2 ** 31
 
 def heap_get(idx, dim):
-    """Get value from heap tensor at index [idx, dim]."""
-    linear_idx = idx * 3 + dim
-    return heap[linear_idx]
+    """Get field dim (0 tag, 1 value/head, 2 tail) of heap row idx."""
+    if dim == 0:
+        return (heap_tags[idx // TAG_BITS] >> (idx % TAG_BITS)) & 1
+    if dim == 1:
+        return heap_heads[idx]
+    return heap_tails[idx]
 
 def heap_set(idx, dim, value):
-    """Set value in heap tensor at index [idx, dim]."""
-    linear_idx = idx * 3 + dim
-    heap[linear_idx] = value
+    """Set field dim (0 tag, 1 value/head, 2 tail) of heap row idx."""
+    if dim == 0:
+        word = heap_tags[idx // TAG_BITS]
+        bit = 1 << (idx % TAG_BITS)
+        word = word | bit if value else word & ~bit
+        heap_tags[idx // TAG_BITS] = to_int32(word)
+    elif dim == 1:
+        heap_heads[idx] = value
+    else:
+        heap_tails[idx] = value
+
+def field(idx, dim):
+    """Address of the head (dim 1) or tail (dim 2) field of heap row idx."""
+    return idx * 2 + dim - 1
+
+def field_get(addr):
+    """Read the noun reference stored at a field address."""
+    return heap_get(addr // 2, addr % 2 + 1)
+
+def field_set(addr, ref):
+    """Store a noun reference at a field address."""
+    heap_set(addr // 2, addr % 2 + 1, ref)
 
 def stack_get(idx, dim):
     """Get value from stack tensor at index [idx, dim]."""
@@ -35,12 +86,29 @@ def stack_set(idx, dim, value):
     linear_idx = idx * 6 + dim
     stack[linear_idx] = value
 
+def is_direct(idx):
+    """Check if a reference holds a small atom inline rather than a heap index."""
+    return idx < 0
+
+def is_vector(idx):
+    """Check if a reference points at a vector noun position."""
+    return idx >= HEAP_SIZE
+
+def vector_span(idx):
+    """Get (start, end) positions of the vector noun at index."""
+    pos = idx - HEAP_SIZE
+    return pos, vector_ends[pos]
+
 def is_cell(idx):
     """Check if noun at index is a cell."""
-    return heap_get(idx, 0) == 1
+    if is_direct(idx):
+        return False
+    return is_vector(idx) or heap_get(idx, 0) == 1
 
 def get_value(idx):
     """Get value of an atom at index."""
+    if is_direct(idx):
+        return -1 - idx
     if is_cell(idx):
         raise ValueError(f"Cannot get value of a cell at index {idx}")
     return heap_get(idx, 1)
@@ -49,18 +117,32 @@ def get_head(idx):
     """Get head index of a cell."""
     if not is_cell(idx):
         raise ValueError(f"Cannot get head of an atom at index {idx}")
+    if is_vector(idx):
+        return vector_elems[idx - HEAP_SIZE]
     return heap_get(idx, 1)
 
 def get_tail(idx):
     """Get tail index of a cell."""
     if not is_cell(idx):
         raise ValueError(f"Cannot get tail of an atom at index {idx}")
+    if is_vector(idx):
+        return vector_at(idx, 1)
     return heap_get(idx, 2)
 
+def vector_at(idx, k):
+    """Get the noun k tail steps into the vector noun at index."""
+    start, end = vector_span(idx)
+    pos = start + k
+    if pos == end - 1:  # last element closes the run
+        return vector_elems[pos]
+    return idx + k
+
 def allocate_atom(value):
-    """Allocate an atom in the heap with given value."""
+    """Allocate an atom with given value, inline if it is small."""
     if value < 0:
         raise ValueError("Nock atoms must be non-negative integers")
+    if value < SMALL_ATOM_LIMIT:
+        return -1 - value
     global free
     if free[0] >= HEAP_SIZE:
         raise MemoryError("Heap overflow")
@@ -83,6 +165,33 @@ def allocate_cell(head_idx, tail_idx):
     free[0] += 1
     return idx
 
+def allocate_temp():
+    """Allocate a scratch row for a task result, return its head field address."""
+    global free
+    if free[0] >= HEAP_SIZE:
+        raise MemoryError("Heap overflow")
+    idx = free[0]
+    heap_set(idx, 0, 0)  # tag atom, never read as a noun
+    heap_set(idx, 1, allocate_atom(0))  # empty until the task writes it
+    heap_set(idx, 2, 0)  # unused
+    free[0] += 1
+    return field(idx, 1)
+
+def allocate_vector(elem_idxs):
+    """Allocate a vector noun equal to the right-nested cells of elem_idxs."""
+    if len(elem_idxs) < 2:
+        raise ValueError("Vector nouns need at least two elements")
+    global vector_free
+    start = vector_free[0]
+    end = start + len(elem_idxs)
+    if end > VECTOR_SIZE:
+        raise MemoryError("Vector overflow")
+    for pos, elem_idx in enumerate(elem_idxs, start):
+        vector_elems[pos] = elem_idx
+        vector_ends[pos] = end
+    vector_free[0] = end
+    return HEAP_SIZE + start
+
 def push(task_type, arg1, arg2, arg3=0, arg4=0, arg5=0):
     """Push a task onto the stack."""
     global top
@@ -92,6 +201,8 @@ def push(task_type, arg1, arg2, arg3=0, arg4=0, arg5=0):
     stack_set(top[0], 1, arg1)
     stack_set(top[0], 2, arg2)
     stack_set(top[0], 3, arg3)
+    stack_set(top[0], 4, arg4)
+    stack_set(top[0], 5, arg5)
     top[0] += 1
 
 def pop():
@@ -104,42 +215,77 @@ def pop():
             stack_get(top[0], 2), stack_get(top[0], 3),
             stack_get(top[0], 4), stack_get(top[0], 5))
 
+def slot_step(n, depth, idx):
+    """Take the next step along the path of slot n, return (index, depth left)."""
+    if not is_cell(idx):
+        raise ValueError(f"Cannot traverse slot {n} from atom at index {idx}")
+    if is_vector(idx):
+        # take the whole run of tail steps at once
+        mask = (1 << depth) - 1
+        tails = depth - (~n & mask).bit_length()
+        start, end = vector_span(idx)
+        steps = min(tails, end - start - 1)
+        if steps > 0:
+            return vector_at(idx, steps), depth - steps
+    depth -= 1
+    if (n >> depth) & 1:  # tail
+        return get_tail(idx), depth
+    return get_head(idx), depth  # head
+
 def slot(n, idx):
     """Fetch the nth slot from noun at idx iteratively."""
     if n < 1:
         raise ValueError("Slot number must be positive")
     current_idx = idx
-    if n == 1:
-        return current_idx
-    while n > 1:
-        if not is_cell(current_idx):
-            raise ValueError(f"Cannot traverse slot {n} from atom at index {current_idx}")
-        if n % 2 == 0:  # head
-            current_idx = get_head(current_idx)
-            n //= 2
-        else:  # tail
-            current_idx = get_tail(current_idx)
-            n = (n - 1) // 2
+    depth = n.bit_length() - 1  # path bits below the leading 1, read high to low
+    while depth > 0:
+        current_idx, depth = slot_step(n, depth, current_idx)
     return current_idx
 
+def slot_batch(ns, idxs):
+    """Fetch slots ns[k] of nouns idxs[k], stepping every lane one level per pass.
+
+    Lanes move in lockstep but each step is still a scalar slot_step read.
+    """
+    if any(n < 1 for n in ns):
+        raise ValueError("Slot number must be positive")
+    current = list(idxs)
+    depths = [n.bit_length() - 1 for n in ns]
+    lanes = [k for k in range(len(ns)) if depths[k] > 0]
+    while lanes:
+        for k in lanes:
+            current[k], depths[k] = slot_step(ns[k], depths[k], current[k])
+        lanes = [k for k in lanes if depths[k] > 0]
+    return current
+
 def noun_equal(a_idx, b_idx):
     """Check if two nouns are equal, equivalent to Nock op5."""
+    # Same reference, including equal inline atoms
+    if a_idx == b_idx:
+        return True
     # Both atoms
     if not is_cell(a_idx) and not is_cell(b_idx):
         return get_value(a_idx) == get_value(b_idx)
     # One atom, one cell
     if is_cell(a_idx) != is_cell(b_idx):
         return False
+    # Both vectors, compare the shared run element by element
+    if is_vector(a_idx) and is_vector(b_idx):
+        a_start, a_end = vector_span(a_idx)
+        b_start, b_end = vector_span(b_idx)
+        shared = min(a_end - a_start, b_end - b_start) - 1
+        for k in range(shared):
+            if not noun_equal(vector_elems[a_start + k], vector_elems[b_start + k]):
+                return False
+        return noun_equal(vector_at(a_idx, shared), vector_at(b_idx, shared))
     # Both cells
     return (noun_equal(get_head(a_idx), get_head(b_idx)) and 
             noun_equal(get_tail(a_idx), get_tail(b_idx)))
 
 
-def op0_compute(subject_idx, formula_idx, result_idx):
+def op0_compute(subject_idx, formula_idx, result):
     if not is_cell(formula_idx):
-        heap_set(result_idx, 0, 0) # Tag as atom
-        heap_set(result_idx, 1, get_value(formula_idx))
-        heap_set(result_idx, 2, 0)
+        field_set(result, formula_idx)
     else:
         head_idx = get_head(formula_idx)
         if is_cell(head_idx):
@@ -151,182 +297,296 @@ def op0_compute(subject_idx, formula_idx, result_idx):
             10: nock_10, 11: nock_11
         }
         if op in handlers:
-            handlers[op](subject_idx, formula_idx, result_idx)
+            handlers[op](subject_idx, formula_idx, result)
         else:
             raise ValueError(f"Unsupported op{op}")
 
-def nock_0(subject_idx, formula_idx, result_idx):
+# Handlers write their result into the field address `result`; temporaries
+# live in the head field of a scratch row so inline atoms never take a row.
+#
+# Push contract (shared by handlers and run_task, relied on by adopt): a task
+# either pushes nothing, pushes only task-0 evaluations that finish its work,
+# or pushes exactly one continuation first followed by the task-0 evaluations
+# that continuation waits on. Pushed tasks must not depend on each other.
+
+def nock_0(subject_idx, formula_idx, result):
     """op0: [a 0 b] → /[b] a (slot operation)."""
     b_idx = get_tail(formula_idx)
     b = get_value(b_idx)
-    slot_idx = slot(b, subject_idx)
-    heap_set(result_idx, 0, heap_get(slot_idx, 0))
-    heap_set(result_idx, 1, heap_get(slot_idx, 1))
-    heap_set(result_idx, 2, heap_get(slot_idx, 2))
+    field_set(result, slot(b, subject_idx))
 
-def nock_1(subject_idx, formula_idx, result_idx):
+def nock_1(subject_idx, formula_idx, result):
     """op1: [a 1 b] → b (constant)."""
-    b_idx = get_tail(formula_idx)
-    heap_set(result_idx, 0, heap_get(b_idx, 0))
-    heap_set(result_idx, 1, heap_get(b_idx, 1))
-    heap_set(result_idx, 2, heap_get(b_idx, 2))
+    field_set(result, get_tail(formula_idx))
 
-def nock_2(subject_idx, formula_idx, result_idx):
+def nock_2(subject_idx, formula_idx, result):
     """op2: [a 2 b c] → *[*[a b] *[a c]]."""
     tail_idx = get_tail(formula_idx)
     b_idx = get_head(tail_idx)
     c_idx = get_tail(tail_idx)
-    temp_x_idx = allocate_atom(0)
-    temp_y_idx = allocate_atom(0)
-    push(10, temp_x_idx, temp_y_idx, result_idx)
-    push(0, subject_idx, c_idx, temp_y_idx)
-    push(0, subject_idx, b_idx, temp_x_idx)
+    pair_idx = allocate_cell(0, 0)  # operands are written straight into the pair
+    field_set(result, pair_idx)
+    push(0, subject_idx, c_idx, field(pair_idx, 2))
+    push(0, subject_idx, b_idx, field(pair_idx, 1))
 
-def nock_3(subject_idx, formula_idx, result_idx):
+def nock_3(subject_idx, formula_idx, result):
     """op3: [a 3 b] → ?*[a b] (is cell)."""
     b_idx = get_tail(formula_idx)
-    temp = allocate_atom(0)  # hold *[a b]
-    push(2, temp, result_idx, 0)  # check if temp is a cell
+    temp = allocate_temp()  # hold *[a b]
+    push(2, temp, result, 0)  # check if temp is a cell
     push(0, subject_idx, b_idx, temp)  # compute *[a b]
 
-def nock_4(subject_idx, formula_idx, result_idx):
+def nock_4(subject_idx, formula_idx, result):
     """op4: [a 4 b] → +*[a b] (increment)."""
     b_idx = get_tail(formula_idx)
-    temp = allocate_atom(0)  # will hold *[a b]
-    push(3, temp, result_idx, 0)  # increment temp
+    temp = allocate_temp()  # will hold *[a b]
+    push(3, temp, result, 0)  # increment temp
     push(0, subject_idx, b_idx, temp)  # compute *[a b]
 
-def nock_5(subject_idx, formula_idx, result_idx):
+def nock_5(subject_idx, formula_idx, result):
     """op5: [a 5 b] → =*[a b] (equals)."""
     b_idx = get_tail(formula_idx)
-    temp = allocate_atom(0)  # *[a b]
-    push(4, temp, result_idx)  # equality check
+    temp = allocate_temp()  # *[a b]
+    push(4, temp, result)  # equality check
     push(0, subject_idx, b_idx, temp)  # compute *[a b]
 
-def nock_6(subject_idx, formula_idx, result_idx):
+def nock_6(subject_idx, formula_idx, result):
     """op6: [a 6 b c d] → *[a c] if *[a b]=0, *[a d] if *[a b]=1."""
     tail_idx = get_tail(formula_idx)
     b_idx = get_head(tail_idx)
     tail_tail_idx = get_tail(tail_idx)
     c_idx = get_head(tail_tail_idx)
     d_idx = get_tail(tail_tail_idx)
-    temp = allocate_atom(0)
-    push(6, temp, c_idx, d_idx, subject_idx, result_idx)  # use indices directly
+    temp = allocate_temp()
+    push(6, temp, c_idx, d_idx, subject_idx, result)  # use indices directly
     push(0, subject_idx, b_idx, temp)
 
-def nock_7(subject_idx, formula_idx, result_idx):
+def nock_7(subject_idx, formula_idx, result):
     """op7: [a 7 b c] → *[*[a b] c] (compose)."""
     tail_idx = get_tail(formula_idx)
     b_idx = get_head(tail_idx)
     c_idx = get_tail(tail_idx)
-    temp = allocate_atom(0)  # *[a b]
-    push(7, temp, c_idx, result_idx)  # compose: *[temp c]
+    temp = allocate_temp()  # *[a b]
+    push(7, temp, c_idx, result)  # compose: *[temp c]
     push(0, subject_idx, b_idx, temp)  # compute *[a b]
 
-def nock_8(subject_idx, formula_idx, result_idx):
+def nock_8(subject_idx, formula_idx, result):
     """op8: [a 8 b c] → *[[*[a b] a] c] (push)."""
     tail_idx = get_tail(formula_idx)
     b_idx = get_head(tail_idx)
     c_idx = get_tail(tail_idx)
-    temp = allocate_atom(0) # *[a b]
-    push(8, temp, subject_idx, c_idx, result_idx)  # pass c_idx directly
-    push(0, subject_idx, b_idx, temp)  # compute *[a b]
+    pair_idx = allocate_cell(0, subject_idx)  # head filled with *[a b]
+    push(1, pair_idx, c_idx, result)  # *[pair c]
+    push(0, subject_idx, b_idx, field(pair_idx, 1))  # compute *[a b]
 
-def nock_9(subject_idx, formula_idx, result_idx):
+def nock_9(subject_idx, formula_idx, result):
     """op9: [a 9 b c] → *[*[a c] /[b] *[a c]] (invoke)."""
     tail_idx = get_tail(formula_idx)
     b_idx = get_head(tail_idx)
     c_idx = get_tail(tail_idx)
-    b = get_value(b_idx)  # slot number
-    core_idx = allocate_atom(0)  # index to hold computed *[a c] (core)
-    push(9, core_idx, b_idx, result_idx) # continuation
-    push(0, subject_idx, c_idx, core_idx)  # compute core *[a c] first
+    core = allocate_temp()  # field to hold computed *[a c] (core)
+    push(9, core, b_idx, result) # continuation
+    push(0, subject_idx, c_idx, core)  # compute core *[a c] first
 
-def nock_10(subject_idx, formula_idx, result_idx):
+def nock_10(subject_idx, formula_idx, result):
     """op10: [a 10 [b c] d] → *[a d] with slot b = c."""
     # simplified, assumes static edit not supported in this context
     # we compute *[a d]
     tail_idx = get_tail(formula_idx)
     edit_idx = get_head(tail_idx)
     d_idx = get_tail(tail_idx)
-    push(0, subject_idx, d_idx, result_idx)  # Compute *[a d]
+    push(0, subject_idx, d_idx, result)  # Compute *[a d]
 
-def nock_11(subject_idx, formula_idx, result_idx):
+def nock_11(subject_idx, formula_idx, result):
     """op11: [a 11 b c] → *[a c]; hints ignored."""
     tail_idx = get_tail(formula_idx)
     _ = get_head(tail_idx)  # b (hint), ignored
     c_idx = get_tail(tail_idx)
-    push(0, subject_idx, c_idx, result_idx)  # compute *[a c]
+    push(0, subject_idx, c_idx, result)  # compute *[a c]
+
+def run_task(task_type, arg1, arg2, arg3=0, arg4=0, arg5=0):
+    """Run one task, pushing follow-up tasks per the push contract above."""
+    if task_type == 0:  # *[subject formula] → field arg3
+        subject_idx, formula_idx, result = arg1, arg2, arg3
+        op0_compute(subject_idx, formula_idx, result)
+
+    elif task_type == 1:  # *[arg1 arg2] → arg3
+        push(0, arg1, arg2, arg3)
+        
+    elif task_type == 2:  # 0 if field arg1 is cell, 1 if atom
+        temp, result = arg1, arg2
+        value = 0 if is_cell(field_get(temp)) else 1
+        field_set(result, allocate_atom(value))
+        
+    elif task_type == 3:  # field arg1 + 1 → arg2
+        temp, result = arg1, arg2
+        temp_idx = field_get(temp)
+        if is_cell(temp_idx):
+            raise ValueError(f"Cannot increment cell at index {temp_idx}")
+        value = get_value(temp_idx)
+        field_set(result, allocate_atom(value + 1))
+        
+    elif task_type == 4:  # =[head tail] of field arg1 → arg2
+        temp, result = arg1, arg2
+        temp_idx = field_get(temp)
+        if not is_cell(temp_idx):
+            raise ValueError(f"Expected cell for equality at index {temp_idx}")
+        value = 0 if noun_equal(get_head(temp_idx), get_tail(temp_idx)) else 1
+        field_set(result, allocate_atom(value))
+        
+    elif task_type == 6:  # if-then-else
+        temp, c_idx, d_idx, subject_idx, result = arg1, arg2, arg3, arg4, arg5
+        temp_idx = field_get(temp)
+        if is_cell(temp_idx):
+            raise ValueError(f"Condition must be an atom at index {temp_idx}")
+        value = get_value(temp_idx)
+        if value == 0:
+            push(0, subject_idx, c_idx, result)
+        elif value == 1:
+            push(0, subject_idx, d_idx, result)
+        else:
+            raise ValueError(f"Invalid condition value {value}")
+            
+    elif task_type == 7:  # *[field arg1, arg2] → arg3
+        push(0, field_get(arg1), arg2, arg3)
+        
+    elif task_type == 9: # continuation for op9 after core is computed
+        core, b_idx, result = arg1, arg2, arg3
+        core_idx = field_get(core)
+        b = get_value(b_idx) 
+        slot_idx = slot(b, core_idx)
+        push(0, core_idx, slot_idx, result)
 
 def nock_interpreter(subject_idx, formula_idx):
     """Evaluate Nock expression *[subject formula], return result index."""
-    result_idx = allocate_cell(0, 0)
-    push(0, subject_idx, formula_idx, result_idx)
+    root = allocate_temp()
+    push(0, subject_idx, formula_idx, root)
     while top[0] > 0:
-        task_type, arg1, arg2, arg3, arg4, arg5 = pop()
-        
-        if task_type == 0:  # *[subject formula] → result_idx
-            subject_idx, formula_idx, result_idx = arg1, arg2, arg3
-            op0_compute(subject_idx, formula_idx, result_idx)
+        run_task(*pop())
+    return field_get(root)
+
+# Wavefront mode: tasks become frames in a dataflow graph. A frame is ready
+# once its pending count of inputs reaches zero; each wave dispatches every
+# ready frame, grouped by kind, and finished frames release their parent.
+
+def frame_get(idx, dim):
+    """Get value from frames tensor at index [idx, dim]."""
+    linear_idx = idx * 8 + dim
+    return frames[linear_idx]
+
+def frame_set(idx, dim, value):
+    """Set value in frames tensor at index [idx, dim]."""
+    linear_idx = idx * 8 + dim
+    frames[linear_idx] = value
+
+def new_frame(parent, pending, task_type, arg1, arg2, arg3=0, arg4=0, arg5=0):
+    """Allocate a frame that releases parent when done, waiting on pending inputs."""
+    global frame_free, frame_pool_top
+    if frame_pool_top[0] > 0:  # reuse a released frame
+        frame_pool_top[0] -= 1
+        idx = frame_pool[frame_pool_top[0]]
+    elif frame_free[0] < FRAME_SIZE:
+        idx = frame_free[0]
+        frame_free[0] += 1
+    else:
+        raise MemoryError("Frame overflow")
+    for dim, value in enumerate((task_type, arg1, arg2, arg3, arg4, arg5, parent, pending)):
+        frame_set(idx, dim, value)
+    return idx
 
-        elif task_type == 1:  # *[arg1 arg2] → arg3
-            push(0, arg1, arg2, arg3)
-            
-        elif task_type == 2:  # 0 if arg1 is cell, 1 if atom
-            temp, result_idx = arg1, arg2
-            value = 0 if is_cell(temp) else 1
-            heap_set(result_idx, 0, 0)
-            heap_set(result_idx, 1, value)
-            heap_set(result_idx, 2, 0)
-            
-        elif task_type == 3:  # arg1 + 1 → arg2
-            temp, result_idx = arg1, arg2
-            if is_cell(temp):
-                raise ValueError(f"Cannot increment cell at index {temp}")
-            value = get_value(temp)
-            heap_set(result_idx, 0, 0)
-            heap_set(result_idx, 1, value + 1)
-            heap_set(result_idx, 2, 0)
-            
-        elif task_type == 4:  # =[head tail] of arg1 → arg2
-            temp, result_idx = arg1, arg2
-            if not is_cell(temp):
-                raise ValueError(f"Expected cell for equality at index {temp}")
-            value = 0 if noun_equal(get_head(temp), get_tail(temp)) else 1
-            heap_set(result_idx, 0, 0)
-            heap_set(result_idx, 1, value)
-            heap_set(result_idx, 2, 0)
-            
-        elif task_type == 6:  # if-then-else
-            temp, c_idx, d_idx, subject_idx, result_idx = arg1, arg2, arg3, arg4, arg5
-            if is_cell(temp):
-                raise ValueError(f"Condition must be an atom at index {temp}")
-            value = get_value(temp)
-            if value == 0:
-                push(0, subject_idx, c_idx, result_idx)
-            elif value == 1:
-                push(0, subject_idx, d_idx, result_idx)
-            else:
-                raise ValueError(f"Invalid condition value {value}")
-                
-        elif task_type == 7:  # *[arg1 arg2] → arg3
-            push(0, arg1, arg2, arg3)
-            
-        elif task_type == 8:  # *[[arg1 arg2] arg3] → arg4
-            temp, subject_idx, c_idx, result_idx = arg1, arg2, arg3, arg4
-            pair_idx = allocate_cell(temp, subject_idx)
-            push(0, pair_idx, c_idx, result_idx)
-            
-        elif task_type == 9: # continuation for op9 after core is computed
-            core_idx, b_idx, result_idx = arg1, arg2, arg3
-            b = get_value(b_idx) 
-            slot_idx = slot(b, core_idx)
-            push(0, core_idx, slot_idx, result_idx)
-
-        elif task_type == 10: # continuation after computing temp_x and temp_y
-            temp_x, temp_y, result_idx = arg1, arg2, arg3
-            heap_set(result_idx, 0, 1)  # Tag: cell
-            heap_set(result_idx, 1, arg1)  # Head = temp_x
-            heap_set(result_idx, 2, arg2)  # Tail = temp_y
-
-    return result_idx
\ No newline at end of file
+def free_frame(idx):
+    """Return a finished frame to the pool."""
+    global frame_pool_top
+    frame_pool[frame_pool_top[0]] = idx
+    frame_pool_top[0] += 1
+
+def frame_task(idx):
+    """Get (task_type, arg1, ..., arg5) of a frame."""
+    return tuple(frame_get(idx, dim) for dim in range(6))
+
+def frame_kind(idx):
+    """Get the dispatch kind of a frame: (task_type, op) for evals, (task_type, None) otherwise."""
+    task_type, formula_idx = frame_get(idx, 0), frame_get(idx, 2)
+    if task_type == 0 and is_cell(formula_idx) and not is_cell(get_head(formula_idx)):
+        return (0, get_value(get_head(formula_idx)))
+    return (task_type, None)
+
+def release(idx, ready):
+    """Mark a frame done, readying its parent once all of the parent's inputs are."""
+    parent = frame_get(idx, 6)
+    free_frame(idx)
+    if parent < 0:
+        return
+    pending = frame_get(parent, 7) - 1
+    frame_set(parent, 7, pending)
+    if pending == 0:
+        ready.append(parent)
+
+def adopt(idx, base, ready):
+    """Turn the tasks frame idx pushed above stack position base into frames."""
+    count = top[0] - base
+    if count == 0:  # wrote its result directly
+        release(idx, ready)
+        return
+    parent = frame_get(idx, 6)
+    positions = range(base, top[0])
+    if any(stack_get(pos, 0) != 0 for pos in positions[1:]):
+        raise RuntimeError(f"Frame {idx} pushed a continuation above position {base}")
+    if stack_get(base, 0) != 0:  # continuation waits on the tasks pushed after it
+        parent = new_frame(parent, count - 1, *(stack_get(base, dim) for dim in range(6)))
+        positions = positions[1:]
+        if count == 1:
+            ready.append(parent)
+    elif parent >= 0:  # idx hands its place in the parent to count inputs
+        frame_set(parent, 7, frame_get(parent, 7) + count - 1)
+    for pos in positions:
+        ready.append(new_frame(parent, 0, *(stack_get(pos, dim) for dim in range(6))))
+    top[0] = base
+    free_frame(idx)  # its place now belongs to the new frames
+
+def dispatch_wave(kind, group, ready):
+    """Run every ready frame of one kind."""
+    if kind == (0, 0):  # op0: walk all slots in lockstep
+        ns = [get_value(get_tail(frame_get(idx, 2))) for idx in group]
+        slot_idxs = slot_batch(ns, [frame_get(idx, 1) for idx in group])
+        for idx, slot_idx in zip(group, slot_idxs):
+            field_set(frame_get(idx, 3), slot_idx)
+    elif kind == (0, 1):  # op1: write all constants in one pass
+        for idx in group:
+            field_set(frame_get(idx, 3), get_tail(frame_get(idx, 2)))
+    elif kind == (3, None):  # op4 continuation: stage operands, one tensor add per chunk
+        for chunk_start in range(0, len(group), WAVE_SIZE):
+            chunk = group[chunk_start:chunk_start + WAVE_SIZE]
+            for k, idx in enumerate(chunk):
+                temp_idx = field_get(frame_get(idx, 1))
+                if is_cell(temp_idx):
+                    raise ValueError(f"Cannot increment cell at index {temp_idx}")
+                wave_operands[k] = get_value(temp_idx)
+            values = wave_operands[:len(chunk)] + wave_ones[:len(chunk)]
+            for k, idx in enumerate(chunk):
+                field_set(frame_get(idx, 2), allocate_atom(values[k]))
+    else:
+        for idx in group:
+            base = top[0]
+            run_task(*frame_task(idx))
+            adopt(idx, base, ready)
+        return
+    for idx in group:
+        release(idx, ready)
+
+def nock_wavefront(subject_idx, formula_idx):
+    """Evaluate *[subject formula] in wavefront mode, return result index."""
+    root = allocate_temp()
+    frame_free[0] = 0
+    frame_pool_top[0] = 0
+    waves[0] = 0
+    ready = [new_frame(-1, 0, 0, subject_idx, formula_idx, root)]
+    while ready:
+        groups = {}
+        for idx in ready:
+            groups.setdefault(frame_kind(idx), []).append(idx)
+        ready = []
+        for kind, group in groups.items():
+            dispatch_wave(kind, group, ready)
+        waves[0] += 1
+    return field_get(root)
@@ -1,4 +1,4 @@
-from .interpreter import heap, heap_get, allocate_atom, allocate_cell, get_head, get_tail
+from .interpreter import allocate_atom, allocate_cell, allocate_vector, is_cell, get_head, get_tail, get_value
 
 def create_noun(noun):
     """Create a noun in the heap from a Python object."""
@@ -9,17 +9,15 @@ def create_noun(noun):
         tail_idx = create_noun(noun[1])
         return allocate_cell(head_idx, tail_idx)
     elif isinstance(noun, list) and len(noun) > 2:
-        result = create_noun(noun[-1])  # Start with the last element
-        for item in reversed(noun[:-1]): # Iterate in reverse, excluding last element
-            result = allocate_cell(create_noun(item), result) # Cell(current_item, previous_result)
-        return result
+        # stored contiguously, reads as [e0 [e1 [... e(n-1)]]]
+        return allocate_vector([create_noun(item) for item in noun])
     else:
         raise ValueError(f"Invalid noun structure: {noun}")
 
 def print_noun(idx):
     """Print the noun at the given index."""
-    if heap_get(idx, 0) == 0:  # Atom
-        print(heap_get(idx, 1), end='')
+    if not is_cell(idx):  # Atom
+        print(get_value(idx), end='')
     else:  # Cell
         print('[', end='')
         print_noun(get_head(idx))
@@ -1,18 +1,25 @@
 import unittest
 from nocktensors.interface import nock
 from nocktensors.utils import create_noun
-from nocktensors.interpreter import free, top, is_cell, get_head, get_tail
+from nocktensors.interpreter import (nock_interpreter, free, top, vector_free, waves, frame_free, push, new_frame, adopt, is_cell, is_vector, get_head, get_tail, get_value,
+                                     heap_get, allocate_atom, allocate_cell, allocate_temp, field_get, slot, noun_equal, SMALL_ATOM_LIMIT)
 
 class TestNockInterpreter(unittest.TestCase):
     def setUp(self):
         # Reset heap and stack pointers before each test
         free[0] = 0
         top[0] = 0
+        vector_free[0] = 0
 
     def test_op0_slot(self):
         self.assertEqual(nock([4, 5], [0, 2]), 4)  # *[ [4 5] [0 2] ] → 4
         self.assertEqual(nock([4, 5], [0, 3]), 5)  # *[ [4 5] [0 3] ] → 5
 
+    def test_op0_deep_slot(self):
+        self.assertEqual(nock([4, [5, 6]], [0, 6]), 5)  # head of tail
+        self.assertEqual(nock([[4, 5], 6], [0, 5]), 5)  # tail of head
+        self.assertEqual(nock([4, [5, 6]], [0, 7]), 6)
+
     def test_op1_constant(self):
         self.assertEqual(nock(42, [1, 3]), 3)  # *[ 42 [1 3] ] → 3
 
@@ -37,8 +44,12 @@ class TestNockInterpreter(unittest.TestCase):
     def test_op7_compose(self):
         self.assertEqual(nock(42, [7, [1, 5], [4, [0, 1]]]), 6)  # *[ *[42 [1 5]] [4 [0 1]] ] → 6
 
+    def test_op6_if_reads_subject(self):
+        self.assertEqual(nock([5, 6], [6, [1, 1], [1, 8], [0, 3]]), 6)  # else branch uses subject
+
     def test_op8_push(self):
         self.assertEqual(nock(42, [8, [1, 7], [0, 2]]), 7) # *[ [7 42] [0 2] ] → 42
+        self.assertEqual(nock(42, [8, [1, 7], [0, 3]]), 42) # *[ [7 42] [0 3] ] → 42
 
     def test_op9_invoke(self):
         self.assertEqual(nock([0, 42], [9, 3, [0, 1]]), 42)  # Invoke slot 3 on [0 42]
@@ -49,5 +60,111 @@ class TestNockInterpreter(unittest.TestCase):
     def test_op11_hint(self):
         self.assertEqual(nock(42, [11, 99, [1, 7]]), 7)  # *[ 42 [1 7] ] → 7 (hint ignored)
 
+    def test_small_atoms_are_inline(self):
+        idx = allocate_atom(7)
+        self.assertEqual(free[0], 0)  # no heap row used
+        self.assertFalse(is_cell(idx))
+        self.assertEqual(get_value(idx), 7)
+
+    def test_large_atoms_use_heap_row(self):
+        idx = allocate_atom(SMALL_ATOM_LIMIT)
+        self.assertEqual(free[0], 1)
+        self.assertEqual(get_value(idx), SMALL_ATOM_LIMIT)
+        self.assertEqual(nock(SMALL_ATOM_LIMIT, [4, [0, 1]]), SMALL_ATOM_LIMIT + 1)
+
+    def test_temp_is_empty_atom_row(self):
+        temp = allocate_temp()
+        self.assertFalse(is_cell(temp // 2))
+        self.assertFalse(is_cell(field_get(temp)))
+        self.assertEqual(get_value(field_get(temp)), 0)
+
+    def test_packed_tags(self):
+        rows = [allocate_cell(0, 0) if i % 3 else allocate_atom(SMALL_ATOM_LIMIT + i) for i in range(70)]
+        for i, idx in enumerate(rows):
+            self.assertEqual(heap_get(idx, 0), 1 if i % 3 else 0)
+
+    def test_vector_slot_matches_cells(self):
+        items = list(range(10, 20))
+        vector_idx = create_noun(items)
+        cells_idx = create_noun(items[-1])
+        for item in reversed(items[:-1]):
+            cells_idx = allocate_cell(create_noun(item), cells_idx)
+        self.assertTrue(is_vector(vector_idx))
+        for n in range(1, 64):
+            try:
+                expected = slot(n, cells_idx)
+            except ValueError:
+                with self.assertRaises(ValueError):
+                    slot(n, vector_idx)
+                continue
+            self.assertTrue(noun_equal(slot(n, vector_idx), expected))
+
+    def test_vector_noun_equal(self):
+        self.assertTrue(noun_equal(create_noun([1, 2, 3]), create_noun([1, [2, 3]])))
+        self.assertTrue(noun_equal(create_noun([1, 2, [3, 4]]), create_noun([1, 2, 3, 4])))
+        self.assertFalse(noun_equal(create_noun([1, 2, 3]), create_noun([1, 2, 4])))
+        self.assertEqual(nock([[1, 2, 3], [1, [2, 3]]], [5, [0, 1]]), 0)
+
+    def test_vector_noun_equal_different_runs(self):
+        a_idx = create_noun(list(range(3000)))
+        b_idx = create_noun(list(range(2998)) + [[2998, 2999]])
+        self.assertTrue(noun_equal(a_idx, b_idx))
+        self.assertFalse(noun_equal(a_idx, create_noun(list(range(2998)) + [[2998, 3000]])))
+        result_idx = nock_interpreter(allocate_cell(a_idx, b_idx), create_noun([5, [0, 1]]))
+        self.assertEqual(get_value(result_idx), 0)  # op5
+
+    def test_vector_round_trip(self):
+        self.assertEqual(nock(0, [1, 1, 2, 3, 4]), [1, [2, [3, 4]]])
+        self.assertEqual(nock([7, 8, 9, 10], [0, 15]), 10)
+
+class TestNockWavefront(unittest.TestCase):
+    def setUp(self):
+        free[0] = 0
+        top[0] = 0
+        vector_free[0] = 0
+
+    def test_matches_stack_mode(self):
+        cases = [
+            ([4, 5], [0, 3]),
+            (42, [1, 3]),
+            (42, [2, [1, 5], [1, 6]]),
+            ([4, 5], [3, [0, 1]]),
+            (7, [4, [0, 1]]),
+            ([4, 5], [5, [0, 1]]),
+            ([5, 6], [6, [1, 1], [1, 8], [0, 3]]),
+            (42, [7, [1, 5], [4, [0, 1]]]),
+            (42, [8, [1, 7], [0, 3]]),
+            ([0, 42], [9, 3, [0, 1]]),
+            (42, [11, 99, [1, 7]]),
+            ([1, 2, 3], [2, [4, [0, 2]], [2, [4, [0, 6]], [4, [4, [0, 7]]]]]),
+        ]
+        for subject, formula in cases:
+            self.assertEqual(nock(subject, formula, wavefront=True), nock(subject, formula))
+
+    def test_wide_formula_takes_few_waves(self):
+        formula = [4, [0, 1]]
+        for _ in range(6):  # 64 independent increments under nested op2 pairs
+            formula = [2, formula, formula]
+        expected = nock(9, formula)
+        self.assertEqual(nock(9, formula, wavefront=True), expected)
+        self.assertEqual(waves[0], 9)  # 6 op2 levels, then op4, op0 and increment waves
+
+    def test_long_loop_reuses_frames(self):
+        # count from 0 to 800: gate [battery counter], recursing via op9 until counter = 800
+        battery = [6, [5, [2, [0, 3], [1, 800]]], [0, 3], [9, 2, [2, [0, 2], [4, [0, 3]]]]]
+        self.assertEqual(nock(0, [9, 2, [1, [battery, 0]]], wavefront=True), 800)
+        self.assertLess(frame_free[0], 10)  # live frames stay bounded
+
+    def test_adopt_rejects_stacked_continuations(self):
+        idx = new_frame(-1, 0, 0, 0, 0)
+        push(7, 0, 0, 0)
+        push(7, 0, 0, 0)  # a second continuation breaks the push contract
+        with self.assertRaises(RuntimeError):
+            adopt(idx, 0, [])
+
+    def test_increment_cell_raises(self):
+        with self.assertRaises(ValueError):
+            nock([1, 2], [2, [4, [0, 2]], [4, [0, 1]]], wavefront=True)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file